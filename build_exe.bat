@@ -11,4 +11,4 @@ rmdir /s /q build
 if exist main.spec del main.spec
 
 REM Build the executable and include chromedriver.exe
-pyinstaller --onefile --add-data "src\chromedriver.exe;src" src\main.py
\ No newline at end of file
+pyinstaller --onefile --add-data "src\chromedriver.exe;src" --add-data "src\js;js" src\main.py
\ No newline at end of file
@@ -6,4 +6,4 @@ Remove-Item -Recurse -Force dist, build -ErrorAction SilentlyContinue
 Remove-Item -Force main.spec -ErrorAction SilentlyContinue
 
 # Build the executable and include chromedriver.exe
-pyinstaller --onefile --add-data "src\chromedriver.exe;src" src\main.py
+pyinstaller --onefile --add-data "src\chromedriver.exe;src" --add-data "src\js;js" src\main.py
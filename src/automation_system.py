@@ -2,13 +2,19 @@
 Main automation system.
 Orchestrates multiple browser instances for web automation.
 """
+import functools
+import sys
 import threading
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Dict, List, Optional
 import logging
 
 from config_models import AutomationConfig
 from browser_automation import WebDriverManager, ProcessManager
 
+if TYPE_CHECKING:
+    from example_app_handlers import Page1Handler, Page2Handler
+
 # Set up logging
 logger = logging.getLogger("automation_system")
 logger.setLevel(logging.INFO)
@@ -17,13 +23,21 @@ formatter = logging.Formatter('[%(levelname)s] %(message)s')
 handler.setFormatter(formatter)
 logger.handlers = [handler]
 
-# Try to load local handlers, fall back to example handlers
-try:
-    from app_handlers import Page1Handler, Page2Handler
-    logger.info("Loaded local handlers from app_handlers.py.")
-except ImportError:
-    logger.info("No local handlers found. Loading from example_app_handlers.py.")
-    from example_app_handlers import Page1Handler, Page2Handler
+# Bound the stack of worker threads created from here on (macOS enforces a 512 KB minimum)
+if sys.platform != 'darwin':
+    threading.stack_size(256 * 1024)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_handlers():
+    """Load local handlers on first use, falling back to example handlers."""
+    try:
+        from app_handlers import Page1Handler, Page2Handler
+        logger.info("Loaded local handlers from app_handlers.py.")
+    except ImportError:
+        logger.info("No local handlers found. Loading from example_app_handlers.py.")
+        from example_app_handlers import Page1Handler, Page2Handler
+    return Page1Handler, Page2Handler
 
 
 class AutomationSystem:
@@ -32,8 +46,10 @@ class AutomationSystem:
     def __init__(self, config: Optional[AutomationConfig] = None):
         self.config = config or AutomationConfig()
         self.driver_managers: List[WebDriverManager] = []
-        self.threads: List[threading.Thread] = []
-        self.monitor_threads: List[threading.Thread] = []
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="auto")
+        self._futures: List[Future] = []
+        self._monitor_future: Optional[Future] = None
+        self._monitor_stop = threading.Event()
         self.is_running = False
 
     def start_automation(self):
@@ -44,18 +60,21 @@ class AutomationSystem:
             page1_driver = WebDriverManager(self.config.webdriver)
             page2_driver = WebDriverManager(self.config.webdriver)
 
-            # Start drivers
-            page1_driver.start_driver()
-            page2_driver.start_driver()
-
             self.driver_managers = [page1_driver, page2_driver]
 
+            # Start drivers in parallel; wait for both so cleanup sees every started driver
+            startups = [self._executor.submit(dm.start_driver) for dm in self.driver_managers]
+            wait(startups)
+            for startup in startups:
+                startup.result()
+
             # Determine test mode
-            test_mode = hasattr(self.config, 'filters') and hasattr(self.config.filters, 'enabled') and not self.config.filters.enabled
+            test_mode = not self.config.filters.enabled
 
             # Create page handlers with test_mode flag
-            page1_handler = Page1Handler(page1_driver, self.config, test_mode=test_mode)
-            page2_handler = Page2Handler(page2_driver, self.config, test_mode=test_mode)
+            page1_handler_cls, page2_handler_cls = _load_handlers()
+            page1_handler = page1_handler_cls(page1_driver, self.config, test_mode=test_mode)
+            page2_handler = page2_handler_cls(page2_driver, self.config, test_mode=test_mode)
 
             # Start automation threads
             self._start_automation_threads(page1_handler, page2_handler)
@@ -70,43 +89,27 @@ class AutomationSystem:
             self.cleanup()
             raise
 
-    def _start_automation_threads(self, page1_handler: Page1Handler,
-                                page2_handler: Page2Handler):
-        """Start the main automation threads."""
-        # Page 1 thread
-        page1_thread = threading.Thread(
-            target=self._run_page1_automation,
-            args=(page1_handler,),
-            name="Page1Automation"
-        )
-
-        # Page 2 thread
-        page2_thread = threading.Thread(
-            target=self._run_page2_automation,
-            args=(page2_handler,),
-            name="Page2Automation"
-        )
-
-        self.threads = [page1_thread, page2_thread]
-
-        # Start threads
-        for thread in self.threads:
-            thread.start()
+    def _start_automation_threads(self, page1_handler: 'Page1Handler',
+                                page2_handler: 'Page2Handler'):
+        """Submit the main automation tasks to the shared worker pool."""
+        self._futures = [
+            self._executor.submit(self._run_page1_automation, page1_handler),
+            self._executor.submit(self._run_page2_automation, page2_handler)
+        ]
 
     def _start_monitoring_threads(self):
-        """Start global browser monitoring thread."""
+        """Start global browser monitoring task."""
         # Register all driver managers for global monitoring
         for driver_manager in self.driver_managers:
             ProcessManager.register_manager(driver_manager)
-        # Start a single thread to monitor all browser closes
-        monitor_thread = threading.Thread(
-            target=ProcessManager.monitor_all_browser_closes,
-            name="GlobalBrowserMonitor"
-        )
-        self.monitor_threads.append(monitor_thread)
-        monitor_thread.start()
-
-    def _run_page1_automation(self, handler: Page1Handler):
+        # Run a single task to monitor all browser closes
+        if self._monitor_future is None or self._monitor_future.done():
+            self._monitor_stop.clear()
+            self._monitor_future = self._executor.submit(
+                ProcessManager.monitor_all_browser_closes, self._monitor_stop
+            )
+
+    def _run_page1_automation(self, handler: 'Page1Handler'):
         """Run page 1 automation logic."""
         try:
             logger.info("Starting page 1 automation...")
@@ -118,7 +121,7 @@ class AutomationSystem:
         except Exception as e:
             logger.error(f"Error in page 1 automation: {e}")
 
-    def _run_page2_automation(self, handler: Page2Handler):
+    def _run_page2_automation(self, handler: 'Page2Handler'):
         """Run page 2 automation logic."""
         try:
             logger.info("Starting page 2 automation...")
@@ -131,15 +134,15 @@ class AutomationSystem:
             logger.error(f"Error in page 2 automation: {e}")
 
     def wait_for_completion(self):
-        """Wait for all automation threads to complete."""
+        """Wait for all automation tasks to complete."""
         if not self.is_running:
             logger.info("Automation system is not running")
             return
 
         try:
-            # Wait for monitoring threads to complete
-            for monitor_thread in self.monitor_threads:
-                monitor_thread.join()
+            # Wait for the monitoring task to complete
+            if self._monitor_future:
+                self._monitor_future.result()
 
             logger.info("All browser windows have been closed")
 
@@ -152,6 +155,9 @@ class AutomationSystem:
         """Clean up resources and terminate processes."""
         logger.info("Cleaning up automation system...")
 
+        # Let the monitor return; pool workers are joined at interpreter exit
+        self._monitor_stop.set()
+
         # Quit all drivers
         for driver_manager in self.driver_managers:
             driver_manager.quit_driver()
@@ -159,6 +165,9 @@ class AutomationSystem:
         # Terminate remaining ChromeDriver processes
         ProcessManager.terminate_remaining_chromedriver_processes()
 
+        # Release the worker pool without blocking on still-running tasks
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
         self.is_running = False
         logger.info("Cleanup completed")
 
@@ -167,8 +176,8 @@ class AutomationSystem:
         return {
             'is_running': self.is_running,
             'active_drivers': len([dm for dm in self.driver_managers if dm.driver]),
-            'active_threads': len([t for t in self.threads if t.is_alive()]),
-            'active_monitors': len([t for t in self.monitor_threads if t.is_alive()])
+            'active_threads': len([f for f in self._futures if not f.done()]),
+            'active_monitors': int(self._monitor_future is not None and not self._monitor_future.done())
         }
 
 
@@ -2,12 +2,10 @@
 Browser automation utilities.
 Handles Chrome WebDriver initialization and common web interactions.
 """
-import os
 import subprocess
-import sys
-import time
+import threading
 import psutil
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -27,6 +25,46 @@ formatter = logging.Formatter('[%(levelname)s] %(message)s')
 handler.setFormatter(formatter)
 logger.handlers = [handler]
 
+# Chrome switches that skip services unused by automation to cut startup time and memory
+CHROME_PERFORMANCE_ARGUMENTS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+)
+
+# Async script budget pinned at session start; longer waits use WebDriverWait instead
+SCRIPT_TIMEOUT_SECONDS = 30
+
+# Calls back true once the selector matches, false after the timeout; runs in the current frame
+WAIT_FOR_SELECTOR_SCRIPT = """
+const selector = arguments[0];
+const done = arguments[arguments.length - 1];
+// Synchronous first check: a malformed selector throws at once instead of timing out
+if (document.querySelector(selector)) {
+    done(true);
+    return;
+}
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(false);
+}, arguments[1]);
+const observer = new MutationObserver(() => {
+    if (document.querySelector(selector)) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+observer.observe(document, {childList: true, subtree: true});
+"""
+
 # Utility to set log level externally
 def set_log_level(level_name: str):
     level = getattr(logging, level_name.upper(), logging.INFO)
@@ -40,30 +78,8 @@ class WebDriverManager:
         self.config = config
         self.driver: Optional[webdriver.Chrome] = None
         self.service_process: Optional[subprocess.Popen] = None
-        self.chrome_driver_path = self._resolve_chromedriver_path()
-
-    def _resolve_chromedriver_path(self) -> str:
-        """Resolves the path to chromedriver.exe for both development and PyInstaller builds."""
-        try:
-            if getattr(sys, 'frozen', False):
-                # Running as a PyInstaller bundle
-                base_path = sys._MEIPASS
-            else:
-                # Running in development
-                base_path = os.path.dirname(__file__)
-            # Try both possible locations
-            possible_paths = [
-                os.path.join(base_path, 'chromedriver.exe'),
-                os.path.join(base_path, 'src', 'chromedriver.exe')
-            ]
-            for chromedriver_path in possible_paths:
-                if os.path.exists(chromedriver_path):
-                    logger.debug(f"Resolved chromedriver.exe path: {chromedriver_path}")
-                    return chromedriver_path
-            raise FileNotFoundError(f"chromedriver.exe not found in any expected location: {possible_paths}")
-        except Exception as e:
-            logger.error(f"Error resolving chromedriver path: {e}")
-            raise
+        self._actions: Optional[ActionChains] = None
+        self.chrome_driver_path = config.chrome_driver_path
 
     def start_driver(self) -> Tuple[webdriver.Chrome, subprocess.Popen]:
         """Start Chrome WebDriver with configured options."""
@@ -73,47 +89,60 @@ class WebDriverManager:
             if self.config.headless_mode:
                 chrome_options.add_argument("--headless")
 
-            # Setup startup info for Windows
-            startup_info = subprocess.STARTUPINFO()
-            startup_info.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-            # Start ChromeDriver service
-            self.service_process = subprocess.Popen(
-                [self.chrome_driver_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-                startupinfo=startup_info
-            )
+            for argument in CHROME_PERFORMANCE_ARGUMENTS:
+                chrome_options.add_argument(argument)
+
+            # No implicit wait, so explicit waits are never compounded by it
+            chrome_options.timeouts = {'implicit': 0, 'script': SCRIPT_TIMEOUT_SECONDS * 1000}
 
-            # Initialize WebDriver (Selenium 4.6+ recommended way)
+            # Initialize WebDriver (Selenium 4.6+ recommended way); the Service spawns ChromeDriver
             service = Service(self.chrome_driver_path)
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.service_process = self.driver.service.process
+            self._actions = None
+
+            # Remember the spawned ChromeDriver PID for targeted cleanup
+            ProcessManager.track_pid(getattr(self.service_process, 'pid', None))
 
             return self.driver, self.service_process
 
         except Exception as e:
-            logger.error(f"Failed to start Chrome WebDriver: {e}")
+            logger.error("Failed to start Chrome WebDriver: %s", e)
             raise
 
-    def wait_for_element(self, by: By, value: str, timeout: int = None) -> Optional[any]:
-        """Wait for element to be present and return it."""
+    def wait_for_element(self, by: By, value: str, timeout: int = None, warn: bool = True) -> Optional[any]:
+        """Wait for element to be present and return it; warn=False logs a miss at debug level."""
         if not self.driver:
             raise RuntimeError("WebDriver not initialized")
 
         timeout = timeout or self.config.default_timeout
+        miss_level = logging.WARNING if warn else logging.DEBUG
+
+        # Ensure 'by' is a string if needed
+        locator = (by.value if hasattr(by, 'value') else by, value)
+
+        if locator[0] == By.CSS_SELECTOR and timeout < SCRIPT_TIMEOUT_SECONDS:
+            try:
+                if self._wait_for_selector_in_page(value, timeout * 1000):
+                    return self.driver.find_element(*locator)
+                logger.log(miss_level, "Element with %s='%s' not found within %s seconds.", by, value, timeout)
+                return None
+            except Exception as e:
+                logger.debug("In-page wait for '%s' failed (%s). Falling back to WebDriverWait.", value, e)
 
         try:
-            # Ensure 'by' is a string if needed
-            locator = (by.value if hasattr(by, 'value') else by, value)
             element = WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located(locator)
             )
             return element
         except TimeoutException:
-            logger.warning(f"Element with {by}='{value}' not found within {timeout} seconds.")
+            logger.log(miss_level, "Element with %s='%s' not found within %s seconds.", by, value, timeout)
             return None
 
+    def _wait_for_selector_in_page(self, css: str, timeout_ms: int) -> bool:
+        """Wait in the current browsing context for a CSS selector to match using a single round trip."""
+        return bool(self.driver.execute_async_script(WAIT_FOR_SELECTOR_SCRIPT, css, timeout_ms))
+
     def click_element_safe(self, by: By, value: str, timeout: int = None) -> bool:
         """Safely click an element with error handling."""
         element = self.wait_for_element(by, value, timeout)
@@ -122,7 +151,7 @@ class WebDriverManager:
                 element.click()
                 return True
             except Exception as e:
-                logger.error(f"Failed to click element {by}='{value}': {e}")
+                logger.error("Failed to click element %s='%s': %s", by, value, e)
                 return False
         return False
 
@@ -131,17 +160,19 @@ class WebDriverManager:
         element = self.wait_for_element(by, value, timeout)
         if element:
             try:
-                actions = ActionChains(self.driver)
-                actions.move_to_element(element).perform()
+                # Reuse one chain per driver; perform() clears its queued actions
+                if self._actions is None:
+                    self._actions = ActionChains(self.driver)
+                self._actions.move_to_element(element).perform()
 
                 if element.is_displayed():
                     element.click()
                     return True
                 else:
-                    logger.warning(f"Element {by}='{value}' is not visible")
+                    logger.warning("Element %s='%s' is not visible", by, value)
                     return False
             except Exception as e:
-                logger.error(f"Failed to interact with element {by}='{value}': {e}")
+                logger.error("Failed to interact with element %s='%s': %s", by, value, e)
                 return False
         return False
 
@@ -151,10 +182,11 @@ class WebDriverManager:
             raise RuntimeError("WebDriver not initialized")
 
         try:
-            self.driver.set_window_position(x, y)
-            self.driver.set_window_size(width, height)
+            # Single W3C setWindowRect command instead of separate position and size calls;
+            # CDP Browser.setWindowBounds would need a getWindowForTarget lookup on top of it
+            self.driver.set_window_rect(x=x, y=y, width=width, height=height)
         except Exception as e:
-            logger.error(f"Failed to set window position/size: {e}")
+            logger.error("Failed to set window position/size: %s", e)
 
     def navigate_to(self, url: str):
         """Navigate to specified URL."""
@@ -163,118 +195,193 @@ class WebDriverManager:
 
         try:
             self.driver.get(url)
-            logger.info(f"Navigated to: {self.driver.title}")
+            # Reading the title is a WebDriver round trip, so only do it when it will be logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Navigated to: %s", self.driver.title)
         except Exception as e:
-            logger.error(f"Failed to navigate to {url}: {e}")
+            logger.error("Failed to navigate to %s: %s", url, e)
+
+    def get_browser_processes(self) -> List[psutil.Process]:
+        """Return the Chrome browser processes launched by this manager's ChromeDriver."""
+        driver_pid = getattr(self.service_process, 'pid', None)
+        if not driver_pid:
+            return []
+        try:
+            # Only Chrome itself: helpers such as conhost.exe live as long as ChromeDriver
+            browsers = []
+            for child in psutil.Process(driver_pid).children():
+                name = child.name().lower()
+                if 'chrome' in name and 'chromedriver' not in name:
+                    browsers.append(child)
+            return browsers
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return []
 
     def quit_driver(self):
         """Safely quit the WebDriver and cleanup ChromeDriver process."""
         # Check if driver exists and its process is alive before quitting
         if self.driver:
             try:
-                # Attempt to get the ChromeDriver process PID
-                driver_pid = None
-                if hasattr(self.driver, 'service') and hasattr(self.driver.service, 'process'):
-                    driver_pid = getattr(self.driver.service.process, 'pid', None)
-                # If PID is available, check if process is alive
-                if driver_pid:
-                    if not psutil.pid_exists(driver_pid):
-                        logger.warning(f"ChromeDriver process (PID {driver_pid}) is not running. Skipping driver.quit().")
-                    else:
-                        self.driver.quit()
+                # poll() reuses the open Popen handle: None while ChromeDriver is alive
+                if self.service_process and self.service_process.poll() is not None:
+                    logger.warning("ChromeDriver process (PID %s) is not running. Skipping driver.quit().",
+                                   self.service_process.pid)
                 else:
-                    # Fallback: try to quit, but catch hanging situations
                     self.driver.quit()
             except Exception as e:
-                logger.error(f"Error occurred while closing browser: {e}")
+                logger.error("Error occurred while closing browser: %s", e)
 
-        # Always attempt to terminate service_process
+        # Always attempt to terminate service_process; only this manager's ChromeDriver is touched,
+        # the global sweep is left to AutomationSystem.cleanup once every driver has quit
         if self.service_process:
             try:
                 self.service_process.terminate()
             except Exception as e:
-                logger.error(f"Error terminating ChromeDriver process: {e}")
-
-        # Force kill any remaining chromedriver.exe processes
-        ProcessManager.terminate_remaining_chromedriver_processes()
+                logger.error("Error terminating ChromeDriver process: %s", e)
+            ProcessManager.untrack_pid(self.service_process.pid)
 
 
 class ProcessManager:
     """Manages browser processes and cleanup."""
 
-    active_managers = []  # Track all active WebDriverManager instances
+    active_managers: tuple = ()  # Immutable snapshot of all active WebDriverManager instances
+    _managers_lock = threading.Lock()  # Serializes writers; readers use the snapshot lock-free
+    _known_pids = set()  # ChromeDriver PIDs spawned by this process
+    _pids_tracked = False  # Whether any PID has ever been tracked
 
     @staticmethod
     def register_manager(manager):
         """Register a WebDriverManager instance for global monitoring."""
-        if manager not in ProcessManager.active_managers:
-            ProcessManager.active_managers.append(manager)
+        with ProcessManager._managers_lock:
+            if manager not in ProcessManager.active_managers:
+                ProcessManager.active_managers = ProcessManager.active_managers + (manager,)
 
     @staticmethod
     def unregister_manager(manager):
         """Unregister a WebDriverManager instance."""
-        if manager in ProcessManager.active_managers:
-            ProcessManager.active_managers.remove(manager)
+        with ProcessManager._managers_lock:
+            ProcessManager.active_managers = tuple(
+                m for m in ProcessManager.active_managers if m is not manager
+            )
+
+    @staticmethod
+    def track_pid(pid: Optional[int]):
+        """Remember a ChromeDriver PID so cleanup can terminate it directly."""
+        if pid:
+            ProcessManager._known_pids.add(pid)
+            ProcessManager._pids_tracked = True
+
+    @staticmethod
+    def untrack_pid(pid: Optional[int]):
+        """Forget a ChromeDriver PID that its manager has already terminated."""
+        ProcessManager._known_pids.discard(pid)
 
     @staticmethod
     def terminate_remaining_chromedriver_processes():
         """Terminate any remaining ChromeDriver processes."""
+        if not ProcessManager._pids_tracked:
+            # Nothing was spawned by us (e.g. recovering from a crash): scan all processes
+            ProcessManager._terminate_chromedriver_processes_by_scan()
+            return
+
+        for pid in list(ProcessManager._known_pids):
+            try:
+                process = psutil.Process(pid)
+                # Guard against PID reuse by an unrelated process
+                if 'chromedriver' in process.name().lower():
+                    logger.info("Terminating remaining ChromeDriver process: %s", pid)
+                    process.terminate()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+            ProcessManager._known_pids.discard(pid)
+
+    @staticmethod
+    def _terminate_chromedriver_processes_by_scan():
+        """Terminate every chromedriver.exe process found on the system."""
         for process in psutil.process_iter(['pid', 'name']):
             try:
                 if 'chromedriver.exe' in process.info['name']:
-                    logger.info(f"Terminating remaining ChromeDriver process: {process.info['pid']}")
+                    logger.info("Terminating remaining ChromeDriver process: %s", process.info['pid'])
                     process.terminate()
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 pass
 
     @staticmethod
-    def monitor_all_browser_closes():
-        """Monitor all registered WebDriverManager instances and cleanup when all browsers are closed or dead."""
+    def monitor_all_browser_closes(stop_event: Optional[threading.Event] = None):
+        """
+        Wait until all registered browsers are closed or dead, or until stop_event is set,
+        then cleanup all drivers.
+        """
+        stop_event = stop_event or threading.Event()
         try:
-            while True:
+            browser_processes = []
+            for manager in ProcessManager.active_managers:
+                if manager.driver:
+                    browser_processes.extend(manager.get_browser_processes())
+
+            if browser_processes:
+                # Wait in the OS for the browser processes to exit instead of polling WebDriver;
+                # bounded waits so a stop request is honoured even if a browser is left open
+                alive = browser_processes
+                while alive and not stop_event.is_set():
+                    _, alive = psutil.wait_procs(
+                        alive,
+                        timeout=1,
+                        callback=lambda process: logger.debug("[Monitor] Browser process %s exited.", process.pid)
+                    )
+            else:
+                logger.warning("[Monitor] No browser processes found. Falling back to window polling.")
+                ProcessManager._wait_for_all_windows_closed(stop_event)
+
+            if stop_event.is_set():
+                logger.info("[Monitor] Stop requested. Cleaning up all drivers.")
+            else:
+                logger.info("All browser windows are closed or dead. Cleaning up all drivers.")
+        except Exception as e:
+            logger.error("Critical error in global browser monitoring: %s", e)
+        finally:
+            for manager in ProcessManager.active_managers:
                 try:
-                    all_closed = True
-                    for manager in ProcessManager.active_managers:
-                        try:
-                            # If driver is None or window_handles is empty, treat as closed
-                            if not manager.driver:
-                                continue
+                    manager.quit_driver()
+                except Exception:
+                    pass
 
-                            # Check window handles with extra safety
-                            try:
-                                handles = manager.driver.window_handles
-                                if not handles:
-                                    continue
-                            except Exception as e:
-                                # Connection error typically means closed
-                                logger.debug(f"[Monitor] Driver {id(manager)} unreachable ({e}). Treating as closed.")
-                                continue
+    @staticmethod
+    def _wait_for_all_windows_closed(stop_event: threading.Event):
+        """Poll window handles of all registered drivers until every browser is closed or dead."""
+        while not stop_event.is_set():
+            try:
+                all_closed = True
+                # Read the snapshot once per iteration; writers swap in a new tuple
+                managers = ProcessManager.active_managers
+                for manager in managers:
+                    try:
+                        # If driver is None or window_handles is empty, treat as closed
+                        if not manager.driver:
+                            continue
 
-                            # If we get here, this manager is active
-                            all_closed = False
-                            break
+                        # Check window handles with extra safety
+                        try:
+                            handles = manager.driver.window_handles
+                            if not handles:
+                                continue
                         except Exception as e:
-                            logger.warn(f"[Monitor] Error checking manager state: {e}")
+                            # Connection error typically means closed
+                            logger.debug("[Monitor] Driver %s unreachable (%s). Treating as closed.", id(manager), e)
                             continue
 
-                    if all_closed:
-                        logger.info("All browser windows are closed or dead. Cleaning up all drivers.")
-                        for manager in ProcessManager.active_managers:
-                            try:
-                                manager.quit_driver()
-                            except Exception:
-                                pass
+                        # If we get here, this manager is active
+                        all_closed = False
                         break
+                    except Exception as e:
+                        logger.warning("[Monitor] Error checking manager state: %s", e)
+                        continue
 
-                except Exception as inner_e:
-                    logger.error(f"Error inside monitor loop: {inner_e}")
-                    # Don't break the loop, just wait and retry
+                if all_closed:
+                    return
 
-                time.sleep(1)
-        except Exception as e:
-            logger.error(f"Critical error in global browser monitoring: {e}")
-            for manager in ProcessManager.active_managers:
-                try:
-                    manager.quit_driver()
-                except Exception:
-                    pass
+            except Exception as inner_e:
+                logger.error("Error inside monitor loop: %s", inner_e)
+                # Don't break the loop, just wait and retry
+
+            stop_event.wait(1)
@@ -2,11 +2,12 @@
 Configuration models for the automation system.
 Contains all configuration data classes.
 """
+import functools
 import os
 import sys
 import logging
-from dataclasses import dataclass, field
-from typing import Dict, List
+from dataclasses import InitVar, asdict, dataclass, field, fields
+from typing import Dict, List, Optional
 
 
 logger = logging.getLogger("config_models")
@@ -17,19 +18,29 @@ handler.setFormatter(formatter)
 logger.handlers = [handler]
 
 
-def get_chromedriver_path():
-    """Return absolute path to chromedriver.exe, handling PyInstaller bundles."""
-    if hasattr(sys, '_MEIPASS'):
-        # If running in a PyInstaller bundle
-        path = os.path.join(sys._MEIPASS, 'src', 'chromedriver.exe')
+@functools.lru_cache(maxsize=1)
+def get_chromedriver_path() -> str:
+    """Return absolute path to chromedriver.exe, handling PyInstaller bundles; resolved once per process."""
+    if getattr(sys, 'frozen', False):
+        # Running as a PyInstaller bundle
+        base_path = sys._MEIPASS
     else:
-        # If running as a script
-        path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'chromedriver.exe'))
-    logger.debug(f"Resolved chromedriver.exe path: {path}")
-    return path
-
-
-@dataclass
+        # Running in development
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    # Try both possible locations
+    possible_paths = [
+        os.path.join(base_path, 'chromedriver.exe'),
+        os.path.join(base_path, 'src', 'chromedriver.exe')
+    ]
+    for chromedriver_path in possible_paths:
+        if os.path.exists(chromedriver_path):
+            logger.debug("Resolved chromedriver.exe path: %s", chromedriver_path)
+            return chromedriver_path
+    # Keep a usable default so config objects can still be built without the binary
+    return possible_paths[0]
+
+
+@dataclass(slots=True)
 class WindowConfig:
     """Configuration for window positioning and sizing."""
     app_window_height: int = 1100
@@ -38,7 +49,7 @@ class WindowConfig:
     window_x_offset: int = -5
 
 
-@dataclass
+@dataclass(slots=True)
 class WebDriverConfig:
     """Configuration for web driver settings."""
     chrome_driver_path: str = field(default_factory=get_chromedriver_path)
@@ -46,55 +57,86 @@ class WebDriverConfig:
     default_timeout: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class AppUrls:
     """URL configurations for the target application."""
     base_url: str = "https://your-target-system.com/app"
     page1_path: str = "/path/to/page1"
     page2_path: str = "/path/to/page2"
+    page1_url: str = field(init=False)
+    page2_url: str = field(init=False)
+
+    def __post_init__(self):
+        self._refresh_urls()
 
-    @property
-    def page1_url(self) -> str:
-        return f"{self.base_url}{self.page1_path}"
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Keep the fully-qualified URLs in sync once construction has set them
+        if name in ('base_url', 'page1_path', 'page2_path') and hasattr(self, 'page2_url'):
+            self._refresh_urls()
 
-    @property
-    def page2_url(self) -> str:
-        return f"{self.base_url}{self.page2_path}"
+    def _refresh_urls(self):
+        """Build the fully-qualified page URLs from their parts."""
+        object.__setattr__(self, 'page1_url', f"{self.base_url}{self.page1_path}")
+        object.__setattr__(self, 'page2_url', f"{self.base_url}{self.page2_path}")
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterConfig:
     """Configuration for element filters."""
     enabled: bool = False
     selectors: List[str] = field(default_factory=list)
 
 
+# Loadable field names of each configuration section, computed once
+_SECTION_FIELDS = {
+    name: frozenset(f.name for f in fields(section_cls) if f.init)
+    for name, section_cls in (
+        ('window', WindowConfig),
+        ('webdriver', WebDriverConfig),
+        ('urls', AppUrls),
+        ('filters', FilterConfig)
+    )
+}
+
+
+@dataclass(slots=True)
 class AutomationConfig:
     """Main configuration class combining all settings."""
+    config_dict: InitVar[Optional[Dict]] = None
+    window: WindowConfig = field(default_factory=WindowConfig)
+    webdriver: WebDriverConfig = field(default_factory=WebDriverConfig)
+    urls: AppUrls = field(default_factory=AppUrls)
+    filters: FilterConfig = field(default_factory=FilterConfig)
 
-    def __init__(self, config_dict: Dict = None):
-        self.window = WindowConfig()
-        self.webdriver = WebDriverConfig()
-        self.urls = AppUrls()
-        self.filters = FilterConfig()
-
+    def __post_init__(self, config_dict: Optional[Dict]):
         if config_dict:
             self._load_from_dict(config_dict)
+        self._validate()
+
+    def _validate(self):
+        """Check configuration invariants once so runtime code can rely on them."""
+        configured_path = self.webdriver.chrome_driver_path
+        if not os.path.exists(configured_path):
+            bundled_path = get_chromedriver_path()
+            if bundled_path != configured_path:
+                logger.warning("Configured chromedriver path %s does not exist; using %s instead.",
+                               configured_path, bundled_path)
+                self.webdriver.chrome_driver_path = bundled_path
+        if self.webdriver.default_timeout <= 0:
+            raise ValueError(f"webdriver.default_timeout must be positive, got {self.webdriver.default_timeout}")
 
     def _load_from_dict(self, config_dict: Dict):
         """Load configuration from dictionary."""
         for section, values in config_dict.items():
-            if hasattr(self, section) and isinstance(values, dict):
-                section_obj = getattr(self, section)
-                for key, value in values.items():
-                    if hasattr(section_obj, key):
-                        setattr(section_obj, key, value)
+            valid_keys = _SECTION_FIELDS.get(section)
+            if valid_keys is None or not isinstance(values, dict):
+                continue
+            section_obj = getattr(self, section)
+            for key, value in values.items():
+                if key in valid_keys:
+                    setattr(section_obj, key, value)
 
     def to_dict(self) -> Dict:
         """Convert configuration to dictionary."""
-        return {
-            'window': self.window.__dict__,
-            'webdriver': self.webdriver.__dict__,
-            'urls': self.urls.__dict__,
-            'filters': self.filters.__dict__
-        }
+        return asdict(self)
@@ -4,6 +4,9 @@ This file serves as a template for creating your own `app_handlers.py`.
 Copy this file to `app_handlers.py` and implement the specific automation
 logic for your application. `app_handlers.py` is ignored by Git.
 """
+import functools
+import pkgutil
+from typing import Tuple
 from selenium.webdriver.common.by import By
 from browser_automation import WebDriverManager
 from config_models import AutomationConfig
@@ -19,12 +22,26 @@ handler.setFormatter(formatter)
 logger.handlers = [handler]
 
 
+# Smart table resizing for Page 1, registered once per driver (see Page1Handler)
+RESIZE_TABLE_HEADERS_SCRIPT = pkgutil.get_data(__name__, 'js/resize_table_headers.js').decode('utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def _screen_size() -> Tuple[int, int]:
+    """Return the primary screen size, probed once per process."""
+    # pyautogui pulls in heavy platform modules, so import it only on first use
+    import pyautogui
+    width, height = pyautogui.size()
+    return width, height
+
+
 class BasePageHandler:
     """Base class for page handlers."""
 
-    def __init__(self, driver_manager: WebDriverManager, config: AutomationConfig):
+    def __init__(self, driver_manager: WebDriverManager, config: AutomationConfig, test_mode: bool = False):
         self.driver_manager = driver_manager
         self.config = config
+        self.test_mode = test_mode
 
     def setup_window_layout(self, x: int, y: int, width: int, height: int):
         """Setup window position and size for this page."""
@@ -34,6 +51,11 @@ class BasePageHandler:
 class Page1Handler(BasePageHandler):
     """Handles automation for the SCADA alarms page."""
 
+    def __init__(self, driver_manager: WebDriverManager, config: AutomationConfig, test_mode: bool = False):
+        super().__init__(driver_manager, config, test_mode)
+        # Register once so every navigation gets the script before app code runs
+        self._resize_script_registered = self._register_resize_script()
+
     def navigate_and_setup(self):
         """Navigate to alarms page and perform initial setup."""
         logger.info("Navigating to Page 1...")
@@ -41,122 +63,43 @@ class Page1Handler(BasePageHandler):
         # TODO: Implement page-specific setup logic here
         # self._close_menu()
         # self._configure_alarm_filters()
-        self._resize_table_headers()
+        # Layout first: it does not depend on the table, which may take a while to render
         self._setup_page1_window_layout()
+        self._resize_table_headers()
+
+    def _register_resize_script(self) -> bool:
+        """Register the table resizing script to run on every new document of this driver."""
+        # Runtime.compileScript/runScript is no use here: persisted scripts belong to one
+        # execution context and are dropped on navigation, while this registration survives it
+        try:
+            self.driver_manager.driver.execute_cdp_cmd(
+                'Page.addScriptToEvaluateOnNewDocument', {'source': RESIZE_TABLE_HEADERS_SCRIPT}
+            )
+            return True
+        except Exception as e:
+            logger.warning("Could not register table resizing script: %s", e)
+            return False
 
     def _resize_table_headers(self):
         """
-        Resize table headers and body cells using JavaScript.
-        Features:
-        - Persistent MutationObserver to handle app re-renders.
-        - Support for manual resizing by detecting user interaction.
-        - "Learns" new widths when user resizes manually.
+        Make sure the smart table resizing script is active on the current page.
+        The script is injected automatically by the browser when registered;
+        otherwise it is sent over WebDriver for this page.
         """
         try:
-            script = """
-                // 1. Initialize Configuration (Persistent across re-runs)
-                if (!window.iaColumnConfig) {
-                    window.iaColumnConfig = {
-                        'select': '50px',
-                        'activeTime': '250px',
-                        'Alternate Language': '750px',
-                        'priority': '100px'
-                    };
-                }
-                
-                // Flag to track if user is currently resizing
-                if (typeof window.iaIsResizing === 'undefined') {
-                    window.iaIsResizing = false;
-                }
-
-                // 2. Event Listeners for Manual Resizing
-                // We use global listeners with delegation to handle dynamic elements
-                if (!window.iaResizeHandlersAttached) {
-                    document.addEventListener('mousedown', function(e) {
-                        if (e.target && e.target.classList.contains('thc-resize-handle')) {
-                            window.iaIsResizing = true;
-                            // console.log("User started resizing");
-                        }
-                    }, true);
-
-                    document.addEventListener('mouseup', function(e) {
-                        if (window.iaIsResizing) {
-                            window.iaIsResizing = false;
-                            // console.log("User finished resizing");
-                            // Force a sync to lock in the new values
-                            applyColumnStyles();
-                        }
-                    }, true);
-                    window.iaResizeHandlersAttached = true;
-                }
-
-                // 3. Main Logic: Apply or Learn Styles
-                function applyColumnStyles() {
-                    const cells = document.querySelectorAll('.ia_table__cell');
-                    let count = 0;
-
-                    // A. If User IS Resizing: LEARN new widths from DOM
-                    if (window.iaIsResizing) {
-                        cells.forEach(cell => {
-                            // Only look at headers to get the 'truth'
-                            if (cell.classList.contains('ia_table__head__header__cell')) {
-                                const colId = cell.getAttribute('data-column-id');
-                                const currentWidth = cell.style.width;
-                                
-                                // Update config if logic exists and we have a valid width
-                                if (colId && window.iaColumnConfig[colId] && currentWidth) {
-                                    window.iaColumnConfig[colId] = currentWidth;
-                                }
-                            }
-                        });
-                        return 0; // Don't enforce styles while dragging
-                    }
-
-                    // B. If User NOT Resizing: ENFORCE widths from Config
-                    cells.forEach(cell => {
-                        const colId = cell.getAttribute('data-column-id');
-                        if (colId && window.iaColumnConfig[colId]) {
-                            const desiredWidth = window.iaColumnConfig[colId];
-                            
-                            // Check if enforcement is needed (avoid expensive DOM writes)
-                            // We use !important to prevent the app from reverting styles randomly
-                            if (cell.style.width !== desiredWidth) {
-                                cell.style.setProperty('width', desiredWidth, 'important');
-                                cell.style.setProperty('min-width', desiredWidth, 'important');
-                                cell.style.setProperty('max-width', desiredWidth, 'important');
-                                cell.style.setProperty('flex', '0 0 ' + desiredWidth, 'important');
-                                cell.style.setProperty('box-sizing', 'border-box', 'important');
-                                cell.style.setProperty('overflow', 'hidden', 'important');
-                                count++;
-                            }
-                        }
-                    });
-                    return count;
-                }
-
-                // 4. Run immediately
-                const initialCount = applyColumnStyles();
-
-                // 5. Setup Observer to persist styles
-                if (!window.iaTableResizeObserver) {
-                    window.iaTableResizeObserver = new MutationObserver((mutations) => {
-                        applyColumnStyles();
-                    });
-                    
-                    window.iaTableResizeObserver.observe(document.body, { 
-                        childList: true, 
-                        subtree: true,
-                        attributes: true, // Watch for style changes too
-                        attributeFilter: ['style', 'class'] 
-                    });
-                }
-                
-                return initialCount;
-            """
-            count = self.driver_manager.driver.execute_script(script)
-            logger.info(f"Initialized smart table resizing setup.")
+            driver = self.driver_manager.driver
+            count = 0
+            if self._resize_script_registered:
+                # The injected script waits for the table itself
+                count = driver.execute_script("return window.iaTableResizeObserver ? 1 : 0")
+            if not count:
+                # One bounded explicit wait for the table, then a single deterministic script call
+                if self.driver_manager.wait_for_element(By.CSS_SELECTOR, '.ia_table__cell', warn=False) is None:
+                    logger.info("Table not rendered yet; resizing will attach when it appears.")
+                count = driver.execute_script("return (" + RESIZE_TABLE_HEADERS_SCRIPT + ")")
+            logger.info("Initialized smart table resizing setup.")
         except Exception as e:
-            logger.warning(f"Could not resize table headers: {e}")
+            logger.warning("Could not resize table headers: %s", e)
 
     def _close_menu(self):
         """(Example) Close the navigation menu."""
@@ -180,15 +123,13 @@ class Page1Handler(BasePageHandler):
 
     def _setup_page1_window_layout(self):
         """Setup window layout for alarms page."""
-        import pyautogui
-        screen_width, screen_height = pyautogui.size()
-        y_position = (self.config.window.app_window_height - self.config.window.app_window_header_height - self.config.window.page1_header_height)
-
-        # Calculate height based on configured total app height to prevent multi-monitor overflow
-        bottom_limit = self.config.window.app_window_height
-        height = bottom_limit - y_position
+        w = self.config.window
+        # Dock the headers strip to the bottom of the configured app height to prevent multi-monitor overflow
+        height = w.app_window_header_height + w.page1_header_height
+        y_position = w.app_window_height - height
 
-        self.setup_window_layout(self.config.window.window_x_offset, y_position, screen_width, height)
+        screen_width, _ = _screen_size()
+        self.setup_window_layout(w.window_x_offset, y_position, screen_width, height)
 
 
 class Page2Handler(BasePageHandler):
@@ -203,8 +144,7 @@ class Page2Handler(BasePageHandler):
 
     def _setup_page2_window_layout(self):
         """Setup window layout for overview page."""
-        import pyautogui
-        screen_width, _ = pyautogui.size()
+        screen_width, _ = _screen_size()
         self.setup_window_layout(
             self.config.window.window_x_offset,
             -self.config.window.app_window_header_height,
@@ -0,0 +1,263 @@
+/*
+ * Smart table resizing for Page 1 (loaded by example_app_handlers.py).
+ * Features:
+ * - Persistent MutationObserver to handle app re-renders.
+ * - Support for manual resizing by detecting user interaction.
+ * - "Learns" new widths when user resizes manually.
+ */
+(function() {
+    function setup() {
+        // 1. Initialize Configuration (Persistent across re-runs)
+        if (!window.iaColumnConfig) {
+            window.iaColumnConfig = {
+                'select': '50px',
+                'activeTime': '250px',
+                'Alternate Language': '750px',
+                'priority': '100px'
+            };
+        }
+        
+        // Flag to track if user is currently resizing
+        if (typeof window.iaIsResizing === 'undefined') {
+            window.iaIsResizing = false;
+        }
+
+        // 2. Event Listeners for Manual Resizing
+        // We use global listeners with delegation to handle dynamic elements
+        if (!window.iaResizeHandlersAttached) {
+            document.addEventListener('mousedown', function(e) {
+                if (e.target && e.target.classList.contains('thc-resize-handle')) {
+                    window.iaIsResizing = true;
+                    // Release the dragged column from the stylesheet so the user sees the resize
+                    const headerCell = e.target.closest('.ia_table__cell');
+                    window.iaResizingColumn = headerCell ? headerCell.dataset.columnId : null;
+                    // Start the drag from the enforced width, not the app's stale inline one
+                    pinColumnWidth(window.iaResizingColumn);
+                    updateStyleSheet();
+                }
+            }, true);
+
+            document.addEventListener('mouseup', function(e) {
+                if (window.iaIsResizing) {
+                    window.iaIsResizing = false;
+                    // Lock in the final width of the dragged column only; other headers still
+                    // carry the app's own inline widths, which must never be learned
+                    const resized = new Set(window.iaChangedHeaders);
+                    if (window.iaResizingColumn) {
+                        document.querySelectorAll('.ia_table__head__header__cell[data-column-id="' +
+                            CSS.escape(window.iaResizingColumn) + '"]').forEach(cell => resized.add(cell));
+                    }
+                    window.iaChangedHeaders = new Set();
+                    learnColumnWidths(resized);
+                    window.iaResizingColumn = null;
+                    updateStyleSheet();
+                }
+            }, true);
+            window.iaResizeHandlersAttached = true;
+        }
+
+        // 3. Main Logic: Apply or Learn Styles
+        // One stylesheet enforces all widths; regenerated only when the config changes
+        function getStyleElement() {
+            let styleEl = document.getElementById('ia-col-style');
+            if (!styleEl) {
+                styleEl = document.createElement('style');
+                styleEl.id = 'ia-col-style';
+                (document.head || document.documentElement).appendChild(styleEl);
+            }
+            return styleEl;
+        }
+
+        function updateStyleSheet() {
+            // We use !important to prevent the app from reverting styles randomly
+            getStyleElement().textContent = Object.entries(window.iaColumnConfig)
+                .filter(([colId]) => colId !== window.iaResizingColumn)
+                .map(([colId, width]) =>
+                    `.ia_table__cell[data-column-id="${CSS.escape(colId)}"]{` +
+                    `width:${width}!important;min-width:${width}!important;` +
+                    `max-width:${width}!important;flex:0 0 ${width}!important;` +
+                    `box-sizing:border-box!important;overflow:hidden!important}`)
+                .join('\n');
+        }
+
+        // Copy the configured width of a column into its cells' inline style
+        function pinColumnWidth(colId) {
+            const width = colId && window.iaColumnConfig[colId];
+            if (!width) {
+                return;
+            }
+            document.querySelectorAll(`.ia_table__cell[data-column-id="${CSS.escape(colId)}"]`)
+                .forEach(cell => { cell.style.width = width; });
+        }
+
+        // LEARN new widths from the headers the user resized
+        function learnColumnWidths(headers) {
+            let changed = false;
+            // Only look at headers to get the 'truth'
+            headers.forEach(cell => {
+                const colId = cell.dataset.columnId;
+                const currentWidth = cell.style.width;
+
+                // Update config if logic exists and we have a valid width
+                if (colId && window.iaColumnConfig[colId] && currentWidth &&
+                    window.iaColumnConfig[colId] !== currentWidth) {
+                    window.iaColumnConfig[colId] = currentWidth;
+                    changed = true;
+                }
+            });
+            if (changed) {
+                updateStyleSheet();
+            }
+        }
+
+        function applyColumnStyles(changedHeaders) {
+            if (window.iaIsResizing) {
+                learnColumnWidths(changedHeaders || []);
+                return 0; // Don't enforce styles while dragging
+            }
+            // The stylesheet applies to current and future cells; only make sure it is attached
+            if (!document.getElementById('ia-col-style')) {
+                updateStyleSheet();
+            }
+            return Object.keys(window.iaColumnConfig).length;
+        }
+
+        // Start from a fresh change set and stylesheet on every (re-)run
+        window.iaChangedHeaders = new Set();
+        updateStyleSheet();
+
+        // 4. Run immediately
+        const initialCount = applyColumnStyles();
+
+        // 5. Setup Observer to persist styles
+        // True when the record adds or removes elements matching the selector
+        function touches(mutation, selector) {
+            const nodes = [...mutation.addedNodes, ...mutation.removedNodes];
+            return nodes.some(node => node.nodeType === Node.ELEMENT_NODE &&
+                (node.matches(selector) || node.querySelector(selector)));
+        }
+
+        // Ignore records that cannot affect table cells (menus, tooltips, charts...)
+        function isTableMutation(mutation) {
+            const target = mutation.target.nodeType === Node.ELEMENT_NODE
+                ? mutation.target : mutation.target.parentElement;
+            if (target && target.closest('[class*="ia_table"]')) {
+                return true;
+            }
+            return touches(mutation, '.ia_table__cell');
+        }
+
+        // Outermost ancestor of the cells that still belongs to the table component
+        function findTableRoot() {
+            let root = document.querySelector('.ia_table__cell');
+            if (!root) {
+                return null;
+            }
+            while (root.parentElement && root.parentElement !== document.body &&
+                   (root.parentElement.getAttribute('class') || '').includes('ia_table')) {
+                root = root.parentElement;
+            }
+            return root;
+        }
+
+        // Observe only the table root, not the whole page
+        function attachTableObserver() {
+            const root = findTableRoot();
+            window.iaTableRoot = root;
+            window.iaTableResizeObserver.disconnect();
+            window.iaTableDetachObserver.disconnect();
+            if (!root) {
+                // Table not rendered yet: wait once at body level, then upgrade to the root
+                if (!window.iaTableWaitObserver) {
+                    window.iaTableWaitObserver = new MutationObserver(() => {
+                        if (document.querySelector('.ia_table__cell')) {
+                            window.iaTableWaitObserver.disconnect();
+                            window.iaTableWaitObserver = null;
+                            attachTableObserver();
+                            applyColumnStyles();
+                        }
+                    });
+                    window.iaTableWaitObserver.observe(document.body, { childList: true, subtree: true });
+                }
+                return;
+            }
+            window.iaTableResizeObserver.observe(root, {
+                childList: true,
+                subtree: true,
+                attributes: true, // Watch for style changes too
+                attributeFilter: ['style', 'class', 'data-column-id']
+            });
+            // Re-scope if the app replaces the table root or any of its ancestors: watch the
+            // direct children of each ancestor only, never the rest of the page
+            window.iaTableAncestors = tableAncestors(root);
+            window.iaTableAncestors.forEach(node =>
+                window.iaTableDetachObserver.observe(node, { childList: true }));
+        }
+
+        // Ancestors of the table root up to the body
+        function tableAncestors(root) {
+            const ancestors = [];
+            for (let node = root.parentElement; node && node !== document.documentElement;
+                 node = node.parentElement) {
+                ancestors.push(node);
+            }
+            return ancestors;
+        }
+
+        if (!window.iaTableResizeObserver) {
+            window.iaTableResizeObserver = new MutationObserver((mutations) => {
+                // Inline style churn on cells is overridden by the stylesheet; only learning needs it
+                if (!window.iaIsResizing && mutations.every(m => m.type === 'attributes' &&
+                        m.attributeName === 'style' && m.target.classList.contains('ia_table__cell'))) {
+                    return;
+                }
+                // Only the headers named in the records need to be re-read
+                if (window.iaIsResizing) {
+                    mutations.forEach(m => {
+                        if (m.type === 'attributes' && m.target.classList.contains('ia_table__head__header__cell')) {
+                            window.iaChangedHeaders.add(m.target);
+                        }
+                    });
+                }
+                // Coalesce all relevant mutations into at most one pass per frame
+                if (window.iaPending || !mutations.some(isTableMutation)) {
+                    return;
+                }
+                window.iaPending = true;
+                requestAnimationFrame(() => {
+                    window.iaPending = false;
+                    const changedHeaders = window.iaChangedHeaders;
+                    window.iaChangedHeaders = new Set();
+                    applyColumnStyles(changedHeaders);
+                });
+            });
+            window.iaTableDetachObserver = new MutationObserver(() => {
+                const root = window.iaTableRoot;
+                if (!root) {
+                    return;
+                }
+                if (!root.isConnected) {
+                    attachTableObserver();
+                    applyColumnStyles();
+                    return;
+                }
+                // Still attached but moved: watch the new chain of ancestors
+                const ancestors = tableAncestors(root);
+                if (ancestors.length !== window.iaTableAncestors.length ||
+                    ancestors.some((node, i) => node !== window.iaTableAncestors[i])) {
+                    attachTableObserver();
+                }
+            });
+        }
+        attachTableObserver();
+
+        return initialCount;
+    }
+
+    // Injected before the DOM exists on new documents: wait for the body
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', setup, { once: true });
+        return 0;
+    }
+    return setup();
+})()
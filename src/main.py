@@ -5,6 +5,7 @@ This script initializes and runs the browser automation system.
 
 from automation_system import AutomationSystem
 from config_models import AutomationConfig
+import copy
 import logging
 
 # Configure logging
@@ -15,6 +16,34 @@ formatter = logging.Formatter('[%(levelname)s] %(message)s')
 handler.setFormatter(formatter)
 logger.handlers = [handler]
 
+# No formatter uses process/thread fields, so skip collecting them for every log record
+logging.logProcesses = False
+logging.logThreads = False
+logging.logMultiprocessing = False
+
+# Defaults for optional top-level config entries
+_DEFAULTS = {
+    "filters": {"enabled": True, "selectors": []},
+    "test_env_host": "localhost",
+    "test_env_port": 8000
+}
+
+
+def _apply_defaults(config_dict: dict) -> dict:
+    """Return a copy of config_dict with missing optional entries filled from _DEFAULTS."""
+    missing = [key for key in _DEFAULTS if key not in config_dict]
+    missing += [f"filters.{key}" for key in _DEFAULTS["filters"] if key not in config_dict.get("filters", {})]
+    if missing:
+        logger.warning("Missing config entries, using defaults: %s", ", ".join(missing))
+    # Deep-copy the defaults so later mutation of the config (e.g. selectors) never leaks into them
+    defaults = copy.deepcopy(_DEFAULTS)
+    return {
+        **defaults,
+        **config_dict,
+        "filters": {**defaults["filters"], **config_dict.get("filters", {})}
+    }
+
+
 def main():
     """Main function that starts the automation system."""
     # Try to load local configuration, fall back to example config
@@ -27,23 +56,15 @@ def main():
         from example_config import LOCAL_APP_CONFIG
         config_dict = LOCAL_APP_CONFIG
 
-    # Ensure filters and enabled exist
-    if "filters" not in config_dict:
-        logger.warning("'filters' section missing in config. Setting default.")
-        config_dict["filters"] = {"enabled": True, "selectors": []}
-    if "enabled" not in config_dict["filters"]:
-        logger.warning("'enabled' flag missing in filters. Setting default True.")
-        config_dict["filters"]["enabled"] = True
-
-    # Ensure test_env_host and test_env_port exist
-    test_env_host = config_dict.get("test_env_host", "localhost")
-    test_env_port = config_dict.get("test_env_port", 8000)
+    config_dict = _apply_defaults(config_dict)
+    test_env_host = config_dict["test_env_host"]
+    test_env_port = config_dict["test_env_port"]
 
     config = AutomationConfig(config_dict)
 
     # Launch test environment server if in test mode
     test_env_server = None
-    if hasattr(config, 'filters') and hasattr(config.filters, 'enabled') and config.filters.enabled is False:
+    if config.filters.enabled is False:
         logger.info(f"Test environment detected: launching local test server at {test_env_host}:{test_env_port} ...")
         from test_env.server_manager import TestEnvServerManager
         test_env_server = TestEnvServerManager(host=test_env_host, port=test_env_port)
@@ -1,7 +1,14 @@
 import http.server
-import socketserver
 import os
-import sys
+from functools import partial
+
+
+class QuietRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that skips per-request access logging."""
+
+    def log_message(self, format, *args):
+        pass
+
 
 class TestEnvServer:
     """
@@ -12,10 +19,14 @@ class TestEnvServer:
         self.port = port
         self.directory = os.path.join(os.path.dirname(__file__), 'pages')
 
+    def create_server(self) -> http.server.ThreadingHTTPServer:
+        """Bind the server without touching the process working directory."""
+        handler = partial(QuietRequestHandler, directory=self.directory)
+        # One thread per request so the browser's parallel asset loads are not serialized
+        return http.server.ThreadingHTTPServer((self.host, self.port), handler)
+
     def run(self):
-        os.chdir(self.directory)
-        handler = http.server.SimpleHTTPRequestHandler
-        with socketserver.TCPServer((self.host, self.port), handler) as httpd:
+        with self.create_server() as httpd:
             print(f"Serving test environment at http://{self.host}:{self.port}/")
             print(f"Serving files from: {self.directory}")
             try:
@@ -1,44 +1,51 @@
-import subprocess
-import sys
-import os
-import signal
+import atexit
+import threading
+
+from test_env.serve_test_env import TestEnvServer
+
 
 class TestEnvServerManager:
     """
-    Manages the test environment HTTP server as a subprocess.
+    Manages the test environment HTTP server on a background thread.
     """
     def __init__(self, host='localhost', port=8000):
         self.host = host
         self.port = port
-        self.process = None
-        self.script_path = os.path.join(os.path.dirname(__file__), 'serve_test_env.py')
+        self.server = None
+        self.thread = None
 
     def start(self):
-        if self.process is not None and self.process.poll() is None:
+        if self.thread is not None and self.thread.is_alive():
             print("Test environment server is already running.")
             return
         try:
-            self.process = subprocess.Popen(
-                [sys.executable, self.script_path, '--host', self.host, '--port', str(self.port)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=os.path.dirname(self.script_path)
+            self.server = TestEnvServer(host=self.host, port=self.port).create_server()
+            self.thread = threading.Thread(
+                target=self.server.serve_forever,
+                name="TestEnvServer",
+                daemon=True
             )
+            self.thread.start()
+            # Close the socket even if the caller never reaches its own cleanup
+            atexit.register(self.stop)
             print(f"Test environment server started at http://{self.host}:{self.port}/")
         except Exception as e:
             print(f"Failed to start test environment server: {e}")
-            self.process = None
+            self.server = None
+            self.thread = None
 
     def stop(self):
-        if self.process and self.process.poll() is None:
+        atexit.unregister(self.stop)
+        if self.server is not None:
             try:
-                if sys.platform == 'win32':
-                    self.process.send_signal(signal.CTRL_BREAK_EVENT)
-                else:
-                    self.process.terminate()
-                self.process.wait(timeout=5)
+                # shutdown() waits for serve_forever to exit, so only call it on a live loop;
+                # the loop polls every 0.5 s, which bounds teardown time
+                if self.thread is not None and self.thread.is_alive():
+                    self.server.shutdown()
+                    self.thread.join(timeout=1.0)
+                self.server.server_close()
                 print("Test environment server stopped.")
             except Exception as e:
                 print(f"Failed to stop test environment server: {e}")
-        self.process = None
-
+        self.server = None
+        self.thread = None